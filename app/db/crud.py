@@ -1,7 +1,18 @@
+"""CRUD helpers for the news aggregator tables.
+
+List helpers apply ``raiseload("*")`` so an accidental lazy load raises instead of
+silently issuing one query per row. Callers that need related objects pass loader
+options explicitly, preferring ``selectinload`` over ``joinedload`` so parent rows
+are not duplicated across child rows.
+"""
+
 from __future__ import annotations
 
+from typing import Sequence
+
 from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.db.models import Article, YoutubeChannel
 
@@ -17,8 +28,12 @@ def create_youtube_channel(session: Session, channel_input: str, active: bool =
     return channel
 
 
-def list_youtube_channels(session: Session, active_only: bool = False) -> list[YoutubeChannel]:
-    stmt = select(YoutubeChannel)
+def list_youtube_channels(
+    session: Session,
+    active_only: bool = False,
+    options: Sequence[ExecutableOption] = (),
+) -> list[YoutubeChannel]:
+    stmt = select(YoutubeChannel).options(raiseload("*"), *options)
     if active_only:
         stmt = stmt.where(YoutubeChannel.active.is_(True))
     return list(session.scalars(stmt))
@@ -77,8 +92,13 @@ def get_article_by_url(session: Session, url: str) -> Article | None:
     return session.scalar(select(Article).where(Article.url == url))
 
 
-def list_articles(session: Session, source_type: str | None = None, limit: int = 50) -> list[Article]:
-    stmt = select(Article)
+def list_articles(
+    session: Session,
+    source_type: str | None = None,
+    limit: int = 50,
+    options: Sequence[ExecutableOption] = (),
+) -> list[Article]:
+    stmt = select(Article).options(raiseload("*"), *options)
     if source_type:
         stmt = stmt.where(Article.source_type == source_type)
     stmt = stmt.order_by(Article.published_at.desc()).limit(limit)
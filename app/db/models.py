@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -13,12 +13,14 @@ class YoutubeChannel(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     channel_input: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # Resolved once and reused on later runs so channel inputs are not looked up on YouTube again.
+    channel_id: Mapped[str | None] = mapped_column(String(24), index=True, nullable=True)
     active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -27,6 +29,15 @@ class Article(Base):
     __table_args__ = (
         UniqueConstraint("url", name="uq_articles_url"),
         UniqueConstraint("source_type", "video_id", name="uq_articles_source_video"),
+        # Serves reads by source, newest first; the leading column also covers source_type-only filters.
+        Index("ix_articles_source_type_published_at", "source_type", "published_at"),
+        # Serves the enrich backlog query (per source, newest first, content still missing).
+        Index(
+            "ix_articles_enrich_needed",
+            "source_type",
+            "published_at",
+            postgresql_where=text("raw_content IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -41,4 +52,4 @@ class Article(Base):
     content_type: Mapped[str | None] = mapped_column(String(32), nullable=True)
     content_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     content_error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Sequence
+from itertools import islice
+from typing import Iterator, Sequence
 
 import feedparser
-import requests
-from dateutil import parser as date_parser
 from pydantic import BaseModel, Field
-from docling.document_converter import DocumentConverter
+import requests
+
+from app.ingest.feeds import entry_fields, iter_recent_entries, parse_entry_datetime, stream_feed_entries
+from app.ingest.markdown import fetch_article_markdown
 
 DEFAULT_ANTHROPIC_FEEDS = [
     "https://raw.githubusercontent.com/Olshansk/rss-feeds/main/feeds/feed_anthropic_news.xml",
@@ -26,78 +30,87 @@ class AnthropicArticleModel(BaseModel):
     feed_url: str | None = None
 
 
+# Plain container for the ingest path; pydantic validation is only paid when building AnthropicArticleModel.
+@dataclass(slots=True, frozen=True)
+class AnthropicFeedEntry:
+    title: str
+    url: str
+    published_at: datetime
+    summary: str | None
+    guid: str | None
+    categories: list[str]
+    feed_url: str | None
+
+
 class AnthropicScraper:
     def __init__(
         self,
         feed_urls: Sequence[str] = DEFAULT_ANTHROPIC_FEEDS,
         request_timeout_seconds: int = 15,
+        session: requests.Session | None = None,
     ) -> None:
         self.feed_urls = list(feed_urls)
         self.request_timeout_seconds = request_timeout_seconds
+        self.session = session
 
-    def fetch_feed(self, feed_url: str) -> feedparser.FeedParserDict:
-        response = requests.get(feed_url, timeout=self.request_timeout_seconds)
-        response.raise_for_status()
-        return feedparser.parse(response.content)
+    def fetch_feed_entries(self, feed_url: str) -> Iterator[feedparser.FeedParserDict]:
+        return stream_feed_entries(feed_url, timeout=self.request_timeout_seconds, session=self.session)
 
     def collect_recent_articles(
         self,
         lookback_hours: int = 24,
         max_articles_per_feed: int | None = None,
+        assume_sorted: bool = True,
+        max_workers: int | None = None,
     ) -> list[AnthropicArticleModel]:
+        entries = self.collect_recent_entries(
+            lookback_hours=lookback_hours,
+            max_articles_per_feed=max_articles_per_feed,
+            assume_sorted=assume_sorted,
+            max_workers=max_workers,
+        )
+        return [AnthropicArticleModel.model_validate(entry, from_attributes=True) for entry in entries]
+
+    def collect_recent_entries(
+        self,
+        lookback_hours: int = 24,
+        max_articles_per_feed: int | None = None,
+        assume_sorted: bool = True,
+        max_workers: int | None = None,
+    ) -> list[AnthropicFeedEntry]:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-        articles: list[AnthropicArticleModel] = []
-
-        for feed_url in self.feed_urls:
-            feed = self.fetch_feed(feed_url)
-            per_feed_count = 0
-
-            for entry in feed.entries:
-                published_at = self.parse_entry_datetime(entry)
-                if published_at is None or published_at < cutoff:
-                    continue
-
-                category_terms = [tag.term for tag in entry.get("tags", []) if getattr(tag, "term", None)]
-                article = AnthropicArticleModel(
-                    title=(entry.get("title") or "").strip(),
-                    url=(entry.get("link") or "").strip(),
-                    published_at=published_at,
-                    summary=(entry.get("description") or "").strip() or None,
-                    guid=(entry.get("id") or entry.get("guid") or "").strip() or None,
-                    categories=category_terms,
-                    feed_url=feed_url,
-                )
-                articles.append(article)
-                per_feed_count += 1
-
-                if max_articles_per_feed is not None and per_feed_count >= max_articles_per_feed:
-                    break
-
-        return articles
+        if not self.feed_urls:
+            return []
+
+        # Feeds are network-bound and independent, so each one is streamed and filtered on its own thread
+        # (one per feed unless capped by max_workers).
+        workers = min(max_workers or len(self.feed_urls), len(self.feed_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_feed = executor.map(
+                lambda feed_url: self._collect_feed_entries(feed_url, cutoff, max_articles_per_feed, assume_sorted),
+                self.feed_urls,
+            )
+            return [entry for feed_entries in per_feed for entry in feed_entries]
+
+    def _collect_feed_entries(
+        self,
+        feed_url: str,
+        cutoff: datetime,
+        max_articles_per_feed: int | None,
+        assume_sorted: bool,
+    ) -> list[AnthropicFeedEntry]:
+        recent = iter_recent_entries(self.fetch_feed_entries(feed_url), cutoff, assume_sorted)
+        return [
+            AnthropicFeedEntry(published_at=published_at, feed_url=feed_url, **entry_fields(entry))
+            for entry, published_at in islice(recent, max_articles_per_feed)
+        ]
 
     def fetch_article_markdown(self, url: str) -> str:
-        converter = DocumentConverter()
-        result = converter.convert(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
-        return result.document.export_to_markdown()
+        return fetch_article_markdown(url)
 
     @staticmethod
     def parse_entry_datetime(entry: feedparser.FeedParserDict) -> datetime | None:
-        published = entry.get("published") or entry.get("updated")
-        if not published:
-            return None
-
-        dt = date_parser.parse(published)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return parse_entry_datetime(entry)
 
 
 DEFAULT_ANTHROPIC_SCRAPER = AnthropicScraper()
@@ -108,16 +121,20 @@ def collect_recent_anthropic_articles(
     max_articles_per_feed: int | None = None,
     feed_urls: Sequence[str] = DEFAULT_ANTHROPIC_FEEDS,
     request_timeout_seconds: int = 15,
+    session: requests.Session | None = None,
+    max_workers: int | None = None,
 ) -> list[AnthropicArticleModel]:
     scraper = (
         DEFAULT_ANTHROPIC_SCRAPER
-        if list(feed_urls) == DEFAULT_ANTHROPIC_SCRAPER.feed_urls
+        if session is None
+        and list(feed_urls) == DEFAULT_ANTHROPIC_SCRAPER.feed_urls
         and request_timeout_seconds == DEFAULT_ANTHROPIC_SCRAPER.request_timeout_seconds
-        else AnthropicScraper(feed_urls=feed_urls, request_timeout_seconds=request_timeout_seconds)
+        else AnthropicScraper(feed_urls=feed_urls, request_timeout_seconds=request_timeout_seconds, session=session)
     )
     return scraper.collect_recent_articles(
         lookback_hours=lookback_hours,
         max_articles_per_feed=max_articles_per_feed,
+        max_workers=max_workers,
     )
 
 
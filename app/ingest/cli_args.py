@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import argparse
+
+
+def positive_int(value: str) -> int:
+    # argparse type for worker counts: ThreadPoolExecutor rejects 0, and a negative count means nothing.
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import IO, Mapping
+
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "news-aggregator")
+# Resolved channel IDs are kept here between CLI runs so handles and URLs are not looked up every time.
+# Set CHANNEL_ID_CACHE_FILE to an empty string to disable.
+CHANNEL_ID_CACHE_FILE = os.getenv("CHANNEL_ID_CACHE_FILE", os.path.join(CACHE_ROOT, "channel_ids.json")).strip()
+CHANNEL_ID_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# Videos found to have no captions, each mapped to the time until which repeat runs skip its transcript request.
+TRANSCRIPT_ABSENT_CACHE_FILE = os.getenv(
+    "TRANSCRIPT_ABSENT_CACHE_FILE",
+    os.path.join(CACHE_ROOT, "transcript_absent.json"),
+).strip()
+
+
+class AtomicWriter:
+    # Writes to a private temp file and swaps it in on a clean exit, so concurrent runs never read a
+    # partial file. The temp file is opened here rather than in __enter__, so an unwritable location
+    # raises OSError before the caller has consumed anything; on any failure the temp file is removed.
+    def __init__(self, path: str | Path, mode: str = "wb", encoding: str | None = None) -> None:
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        self.file: IO = open(self.tmp_path, mode, encoding=encoding)
+
+    def __enter__(self) -> IO:
+        return self.file
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        try:
+            self.file.close()
+            if exc_type is None:
+                os.replace(self.tmp_path, self.path)
+                return
+        except BaseException:
+            self.tmp_path.unlink(missing_ok=True)
+            raise
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def read_json_cache(path: str) -> dict:
+    if not path:
+        return {}
+
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_json_cache(path: str, entries: dict) -> None:
+    # Caches are an optimization, so a file that cannot be written is skipped rather than raised.
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with AtomicWriter(path, "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+    except OSError:
+        pass
+
+
+def load_channel_id_cache(path: str = CHANNEL_ID_CACHE_FILE) -> dict[str, str]:
+    now = time.time()
+    return {
+        channel_input: entry["channel_id"]
+        for channel_input, entry in _read_channel_id_cache(path).items()
+        if now - entry.get("resolved_at", 0) < CHANNEL_ID_CACHE_TTL_SECONDS
+    }
+
+
+def save_channel_id_cache(channel_ids: Mapping[str, str], path: str = CHANNEL_ID_CACHE_FILE) -> None:
+    if not path or not channel_ids:
+        return
+
+    entries = _read_channel_id_cache(path)
+    resolved_at = time.time()
+    for channel_input, channel_id in channel_ids.items():
+        entries[channel_input] = {"channel_id": channel_id, "resolved_at": resolved_at}
+    write_json_cache(path, entries)
+
+
+def load_transcript_absent_cache(path: str = TRANSCRIPT_ABSENT_CACHE_FILE) -> dict[str, float]:
+    now = time.time()
+    return {
+        video_id: skip_until
+        for video_id, skip_until in read_json_cache(path).items()
+        if isinstance(skip_until, (int, float)) and skip_until > now
+    }
+
+
+def save_transcript_absent_cache(video_ids: Mapping[str, float], path: str = TRANSCRIPT_ABSENT_CACHE_FILE) -> None:
+    if not path or not video_ids:
+        return
+
+    # Expired entries are dropped here so the file only holds videos that are still skipped.
+    entries = load_transcript_absent_cache(path)
+    entries.update(video_ids)
+    write_json_cache(path, entries)
+
+
+def _read_channel_id_cache(path: str) -> dict[str, dict]:
+    return {
+        channel_input: entry
+        for channel_input, entry in read_json_cache(path).items()
+        if isinstance(entry, dict) and isinstance(entry.get("channel_id"), str)
+    }
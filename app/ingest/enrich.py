@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Sequence
 
-from sqlalchemy import select
+import requests
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.db import SessionLocal, init_db
@@ -11,16 +15,65 @@ from app.ingest.anthropic import AnthropicScraper
 from app.ingest.openai import OpenAINewsScraper
 from app.ingest.youtube import YouTubeSurfaceScraper
 
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_COMMIT_EVERY = 10
+ENRICH_SOURCE_TYPES = ("openai", "anthropic", "youtube")
+DEFAULT_ENRICH_CONCURRENCY = DEFAULT_FETCH_WORKERS * len(ENRICH_SOURCE_TYPES)
 
-def run_enrich(lookback_hours: int = 24, max_items: int | None = None) -> dict:
+
+@dataclass(slots=True)
+class EnrichResult:
+    article: Article
+    raw_content: str | None = None
+    content_type: str | None = None
+    video_id: str | None = None
+    error: str | None = None
+
+
+def run_enrich(
+    lookback_hours: int = 24,
+    max_items: int | None = None,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+    http_session: requests.Session | None = None,
+    concurrency: int = DEFAULT_ENRICH_CONCURRENCY,
+) -> dict:
     init_db()
-    session = SessionLocal()
+    # Keep loaded articles usable across the batch commits below without reloading them.
+    session = SessionLocal(expire_on_commit=False)
     try:
-        updated = 0
-        updated += enrich_openai_articles(session, lookback_hours, max_items=max_items)
-        updated += enrich_anthropic_articles(session, lookback_hours, max_items=max_items)
-        updated += enrich_youtube_articles(session, lookback_hours, max_items=max_items)
+        items = _select_missing_content_multi(session, ENRICH_SOURCE_TYPES, lookback_hours, max_items)
+        # End the read transaction so nothing is held open while content downloads.
         session.commit()
+
+        openai_fetch = OpenAINewsScraper().fetch_article_markdown
+        anthropic_fetch = AnthropicScraper().fetch_article_markdown
+
+        # Every source shares one pool; results are applied to the session on this thread as they finish.
+        with (
+            YouTubeSurfaceScraper(session=http_session, transcript_workers=concurrency) as youtube_scraper,
+            ThreadPoolExecutor(max_workers=concurrency) as executor,
+        ):
+            futures = [
+                executor.submit(_fetch_markdown_one, article, article.url, openai_fetch, "markdown")
+                for article in items["openai"]
+            ]
+            futures += [
+                executor.submit(_fetch_markdown_one, article, article.url, anthropic_fetch, "markdown")
+                for article in items["anthropic"]
+            ]
+            futures += [
+                executor.submit(
+                    _fetch_transcript_one,
+                    article,
+                    article.url,
+                    article.video_id,
+                    youtube_scraper,
+                    article.published_at,
+                )
+                for article in items["youtube"]
+            ]
+            updated = _apply_in_batches(session, _completed(futures), commit_every)
+
         return {"updated": updated}
     except Exception:
         session.rollback()
@@ -41,33 +94,15 @@ def enrich_anthropic_articles(session: Session, lookback_hours: int, max_items:
     return _enrich_markdown(session, items, scraper.fetch_article_markdown, content_type="markdown")
 
 
-def enrich_youtube_articles(session: Session, lookback_hours: int, max_items: int | None = None) -> int:
-    scraper = YouTubeSurfaceScraper()
+def enrich_youtube_articles(
+    session: Session,
+    lookback_hours: int,
+    max_items: int | None = None,
+    http_session: requests.Session | None = None,
+) -> int:
     items = _select_missing_content(session, "youtube", lookback_hours, max_items)
-    updated = 0
-    for article in items:
-        try:
-            if not article.video_id:
-                article.video_id = scraper.extract_video_id(article.url)
-
-            if not article.video_id:
-                raise ValueError("Unable to extract video_id from URL.")
-
-            transcript, error = scraper.get_video_transcript(article.video_id, ["en", "en-US"])
-            if error:
-                article.content_error = error
-            else:
-                article.raw_content = transcript.text if transcript else None
-                article.content_type = "transcript"
-                article.content_error = None
-
-            article.content_fetched_at = datetime.now(timezone.utc)
-            updated += 1
-        except Exception as exc:  # noqa: BLE001
-            article.content_error = str(exc)
-            article.content_fetched_at = datetime.now(timezone.utc)
-            updated += 1
-    return updated
+    with YouTubeSurfaceScraper(session=http_session) as scraper:
+        return _enrich_transcripts(session, items, scraper)
 
 
 def _select_missing_content(
@@ -76,17 +111,41 @@ def _select_missing_content(
     lookback_hours: int,
     max_items: int | None,
 ) -> list[Article]:
+    return _select_missing_content_multi(session, [source_type], lookback_hours, max_items)[source_type]
+
+
+def _select_missing_content_multi(
+    session: Session,
+    source_types: Sequence[str],
+    lookback_hours: int,
+    max_items: int | None,
+) -> dict[str, list[Article]]:
     cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-    stmt = (
-        select(Article)
-        .where(Article.source_type == source_type)
-        .where(Article.raw_content.is_(None))
-        .where(Article.published_at >= cutoff)
-        .order_by(Article.published_at.desc())
+    criteria = (
+        Article.source_type.in_(source_types),
+        Article.raw_content.is_(None),
+        Article.published_at >= cutoff,
     )
+    stmt = select(Article).where(*criteria)
     if max_items:
-        stmt = stmt.limit(max_items)
-    return list(session.scalars(stmt))
+        # Cap each source separately in the same query by ranking rows within their source_type.
+        ranked = (
+            select(
+                Article.id,
+                func.row_number()
+                .over(partition_by=Article.source_type, order_by=Article.published_at.desc())
+                .label("rank"),
+            )
+            .where(*criteria)
+            .subquery()
+        )
+        stmt = select(Article).join(ranked, Article.id == ranked.c.id).where(ranked.c.rank <= max_items)
+    stmt = stmt.order_by(Article.published_at.desc())
+
+    items: dict[str, list[Article]] = {source_type: [] for source_type in source_types}
+    for article in session.scalars(stmt):
+        items[article.source_type].append(article)
+    return items
 
 
 def _enrich_markdown(
@@ -95,17 +154,110 @@ def _enrich_markdown(
     fetch_fn,
     *,
     content_type: str,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
 ) -> int:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_fetch_markdown_one, article, article.url, fetch_fn, content_type) for article in items
+        ]
+        return _apply_in_batches(session, _completed(futures), commit_every)
+
+
+def _enrich_transcripts(
+    session: Session,
+    items: list[Article],
+    scraper: YouTubeSurfaceScraper,
+    *,
+    max_workers: int = DEFAULT_FETCH_WORKERS,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+) -> int:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _fetch_transcript_one, article, article.url, article.video_id, scraper, article.published_at
+            )
+            for article in items
+        ]
+        return _apply_in_batches(session, _completed(futures), commit_every)
+
+
+# Workers get plain column values read on the calling thread and never touch ORM attributes,
+# because a batch commit may expire the articles while fetches are still running.
+def _fetch_markdown_one(article: Article, url: str, fetch_fn, content_type: str) -> EnrichResult:
+    try:
+        return EnrichResult(article=article, raw_content=fetch_fn(url), content_type=content_type)
+    except Exception as exc:  # noqa: BLE001
+        return EnrichResult(article=article, error=str(exc))
+
+
+def _fetch_transcript_one(
+    article: Article,
+    url: str,
+    video_id: str | None,
+    scraper: YouTubeSurfaceScraper,
+    published_at: datetime | None = None,
+) -> EnrichResult:
+    # Only report a video_id when it was newly extracted, so applying it never has to read the article.
+    extracted_video_id = None
+    try:
+        if not video_id:
+            video_id = extracted_video_id = scraper.extract_video_id(url)
+
+        if not video_id:
+            raise ValueError("Unable to extract video_id from URL.")
+
+        transcript, error = scraper.fetch_transcript(video_id, ["en", "en-US"], published_at=published_at)
+        if error:
+            return EnrichResult(article=article, video_id=extracted_video_id, error=error)
+        return EnrichResult(
+            article=article,
+            raw_content=transcript.text if transcript else None,
+            content_type="transcript",
+            video_id=extracted_video_id,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return EnrichResult(article=article, video_id=extracted_video_id, error=str(exc))
+
+
+def _completed(futures: list[Future]) -> Iterator[EnrichResult]:
+    for future in as_completed(futures):
+        yield future.result()
+
+
+def _apply_in_batches(session: Session, results: Iterable[EnrichResult], commit_every: int) -> int:
+    # Commit every few articles so finished work is durable and no transaction spans the whole run.
+    updated = 0
+    batch: list[EnrichResult] = []
+    for result in results:
+        batch.append(result)
+        if len(batch) >= commit_every:
+            updated += _apply_results(batch)
+            session.commit()
+            batch.clear()
+
+    if batch:
+        updated += _apply_results(batch)
+        session.commit()
+    return updated
+
+
+def _apply_results(results: list[EnrichResult]) -> int:
+    # One timestamp per batch: every article in it was fetched in the same pass.
+    fetched_at = datetime.now(timezone.utc)
     updated = 0
-    for article in items:
-        try:
-            article.raw_content = fetch_fn(article.url)
-            article.content_type = content_type
+    for result in results:
+        article = result.article
+        if result.video_id:
+            article.video_id = result.video_id
+
+        if result.error is not None:
+            article.content_error = result.error
+        else:
+            article.raw_content = result.raw_content
+            article.content_type = result.content_type
             article.content_error = None
-            article.content_fetched_at = datetime.now(timezone.utc)
-            updated += 1
-        except Exception as exc:  # noqa: BLE001
-            article.content_error = str(exc)
-            article.content_fetched_at = datetime.now(timezone.utc)
-            updated += 1
+
+        article.content_fetched_at = fetched_at
+        updated += 1
     return updated
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import itertools
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping
+import xml.etree.ElementTree as ET
+
+import feedparser
+from feedparser.sanitizer import _sanitize_html
+from dateutil import parser as date_parser
+import requests
+
+from app.ingest.disk_cache import CACHE_ROOT, AtomicWriter, read_json_cache, write_json_cache
+from app.ingest.http_client import HTTP_SESSION
+
+# Feeds list entries newest first; after this many consecutive entries older than the cutoff,
+# the rest of the feed is assumed to be older too. A small streak tolerates the odd out-of-order item.
+STALE_ENTRY_LIMIT = 3
+
+# Local element names (namespace stripped) mapped to the feedparser keys the scrapers read.
+RSS_ITEM_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "description",
+    "pubDate": "published",
+    "date": "updated",
+    "guid": "id",
+}
+ATOM_ENTRY_FIELDS = {
+    "title": "title",
+    "summary": "description",
+    "published": "published",
+    "updated": "updated",
+    "id": "id",
+}
+# Fields that may carry markup; feedparser ran these through its HTML sanitizer, so they still are.
+HTML_FIELDS = frozenset(("title", "description"))
+# RSS 1.0 (RDF) items identify themselves with this attribute instead of a <guid>.
+RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
+
+
+# Entry element name and field map per feed format.
+FEED_FORMATS = {
+    "rss": ("item", RSS_ITEM_FIELDS),
+    "atom": ("entry", ATOM_ENTRY_FIELDS),
+}
+FEED_CHUNK_BYTES = 64 * 1024
+# Feed bodies and their ETag/Last-Modified validators are kept here between runs so unchanged
+# feeds come back as an empty 304. Set FEED_CACHE_DIR to an empty string to disable.
+FEED_CACHE_DIR = os.getenv("FEED_CACHE_DIR", os.path.join(CACHE_ROOT, "feeds")).strip()
+
+# A feed URL keeps its format, so its root element is checked on the first fetch only.
+_feed_formats: dict[str, str] = {}
+
+
+def stream_feed_entries(
+    url: str,
+    timeout: int,
+    session: requests.Session | None = None,
+) -> Iterator[feedparser.FeedParserDict]:
+    cache_paths = _feed_cache_paths(url)
+    headers = _conditional_headers(*cache_paths) if cache_paths else {}
+
+    with (session or HTTP_SESSION).get(url, timeout=timeout, stream=True, headers=headers) as response:
+        body_path: Path | None = None
+        if cache_paths and response.status_code == 304:
+            body_path = cache_paths[0]
+        else:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=FEED_CHUNK_BYTES)
+            if cache_paths and ("ETag" in response.headers or "Last-Modified" in response.headers):
+                # An unwritable cache leaves chunks untouched, and the body is parsed from the network instead.
+                if _store_feed_body(chunks, response.headers, *cache_paths):
+                    body_path = cache_paths[0]
+
+        # Bodies that are not on disk are kept in memory so a rejected feed can be re-parsed.
+        received: list[bytes] = []
+        if body_path is not None:
+            chunks = _iter_file(body_path)
+        else:
+            chunks = _record_chunks(chunks, received)
+
+        head: list[bytes] = []
+        feed_format = _feed_formats.get(url)
+        if feed_format is None:
+            feed_format = detect_feed_format(chunks, head)
+            # Only a format read from the root element is remembered; undetectable bodies fall back to RSS.
+            if feed_format is not None:
+                _feed_formats[url] = feed_format
+
+        yielded = 0
+        try:
+            for entry in iter_feed_entries(itertools.chain(head, chunks), feed_format or "rss"):
+                yielded += 1
+                yield entry
+        except ET.ParseError:
+            # expat rejects what real-world feeds get away with (HTML entities, stray bytes);
+            # feedparser tolerates them, so re-parse the whole body leniently and skip what was yielded.
+            if body_path is not None:
+                body = body_path.read_bytes()
+            else:
+                for _ in chunks:
+                    pass
+                body = b"".join(received)
+            yield from feedparser.parse(body).entries[yielded:]
+
+
+def iter_recent_entries(
+    entries: Iterable[feedparser.FeedParserDict],
+    cutoff: datetime,
+    assume_sorted: bool = True,
+) -> Iterator[tuple[feedparser.FeedParserDict, datetime]]:
+    # Yields (entry, published_at) for entries at or after the cutoff. With assume_sorted, stops pulling
+    # entries after STALE_ENTRY_LIMIT consecutive older ones.
+    stale_streak = 0
+    for entry in entries:
+        published_at = parse_entry_datetime(entry)
+        if published_at is None:
+            continue
+        if published_at < cutoff:
+            stale_streak += 1
+            if assume_sorted and stale_streak >= STALE_ENTRY_LIMIT:
+                return
+            continue
+        stale_streak = 0
+        yield entry, published_at
+
+
+def entry_fields(entry: feedparser.FeedParserDict) -> dict:
+    # The article fields both RSS scrapers store, stripped and with empty strings turned into None.
+    get = entry.get
+    return {
+        "title": (get("title") or "").strip(),
+        "url": (get("link") or "").strip(),
+        "summary": (get("description") or "").strip() or None,
+        "guid": (get("id") or get("guid") or "").strip() or None,
+        # Tag dicts always carry "term", so no getattr fallback is needed.
+        "categories": [tag.term for tag in get("tags") or () if tag.term],
+    }
+
+
+def _feed_cache_paths(url: str) -> tuple[Path, Path] | None:
+    if not FEED_CACHE_DIR:
+        return None
+
+    cache_dir = Path(FEED_CACHE_DIR)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.xml", cache_dir / f"{key}.json"
+
+
+def _conditional_headers(body_path: Path, meta_path: Path) -> dict[str, str]:
+    if not body_path.exists():
+        return {}
+
+    meta = read_json_cache(str(meta_path))
+    headers: dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _store_feed_body(
+    chunks: Iterable[bytes],
+    response_headers: Mapping[str, str],
+    body_path: Path,
+    meta_path: Path,
+) -> bool:
+    # The temp file is opened before any chunk is read, so a False return means chunks is untouched.
+    try:
+        writer = AtomicWriter(body_path)
+    except OSError:
+        return False
+    with writer as file:
+        for chunk in chunks:
+            file.write(chunk)
+
+    # The body is cached either way; without validators the next run simply fetches it in full.
+    meta = {"etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")}
+    write_json_cache(str(meta_path), meta)
+    return True
+
+
+def _record_chunks(chunks: Iterable[bytes], received: list[bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        received.append(chunk)
+        yield chunk
+
+
+def _iter_file(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(FEED_CHUNK_BYTES):
+            yield chunk
+
+
+def detect_feed_format(chunks: Iterator[bytes], consumed: list[bytes]) -> str | None:
+    # Reads chunks (appending them to consumed) until the root element opens: Atom's is <feed>,
+    # RSS 2.0 and RSS 1.0 (RDF) both list <item> entries.
+    parser = ET.XMLPullParser(events=("start",))
+    for chunk in chunks:
+        consumed.append(chunk)
+        try:
+            parser.feed(chunk)
+        except ET.ParseError:
+            return None
+        for _, element in parser.read_events():
+            return "atom" if _local_name(element.tag) == "feed" else "rss"
+    return None
+
+
+def iter_feed_entries(chunks: Iterable[bytes], feed_format: str) -> Iterator[feedparser.FeedParserDict]:
+    # Parse incrementally and drop each entry once yielded so memory stays flat for large feeds.
+    entry_name, fields = FEED_FORMATS[feed_format]
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _read_entries(parser, entry_name, fields)
+    parser.close()
+    yield from _read_entries(parser, entry_name, fields)
+
+
+def _read_entries(
+    parser: ET.XMLPullParser,
+    entry_name: str,
+    fields: dict[str, str],
+) -> Iterator[feedparser.FeedParserDict]:
+    for _, element in parser.read_events():
+        if _local_name(element.tag) == entry_name:
+            yield _entry_from_element(element, fields)
+            element.clear()
+
+
+def _entry_from_element(element: ET.Element, fields: dict[str, str]) -> feedparser.FeedParserDict:
+    entry = feedparser.FeedParserDict()
+    tags: list[feedparser.FeedParserDict] = []
+    # Atom entries may carry only <content>; like feedparser, it stands in for a missing <summary>.
+    content: ET.Element | None = None
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "category":
+            term = child.get("term") or (child.text or "").strip()
+            if term:
+                tags.append(feedparser.FeedParserDict(term=term))
+        elif name == "link" and "href" in child.attrib:
+            if child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = child.get("href")
+        elif name in fields and fields[name] not in entry:
+            entry[fields[name]] = _field_text(child, fields[name])
+        elif name == "content" and content is None:
+            content = child
+    if content is not None and "description" not in entry:
+        entry["description"] = _field_text(content, "description")
+    if "id" not in entry and RDF_ABOUT in element.attrib:
+        entry["id"] = element.get(RDF_ABOUT)
+    entry["tags"] = tags
+    return entry
+
+
+def _field_text(child: ET.Element, key: str) -> str:
+    if child.get("type") == "xhtml":
+        # Inline XHTML arrives as elements inside a wrapper <div>, not as text.
+        text = _inner_xhtml(child)
+    else:
+        text = (child.text or "").strip()
+    if key in HTML_FIELDS and "<" in text:
+        text = _sanitize_html(text, "utf-8", "text/html").strip()
+    return text
+
+
+def _inner_xhtml(element: ET.Element) -> str:
+    wrapper = element[0] if len(element) and _local_name(element[0].tag) == "div" else element
+    for node in wrapper.iter():
+        node.tag = _local_name(node.tag)
+    parts = [wrapper.text or ""]
+    parts.extend(ET.tostring(node, encoding="unicode") for node in wrapper)
+    return "".join(parts).strip()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_entry_datetime(entry: feedparser.FeedParserDict) -> datetime | None:
+    # feedparser already normalizes RSS/Atom dates into a UTC struct_time.
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        return datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
+
+    published = entry.get("published") or entry.get("updated")
+    if not published:
+        return None
+
+    dt = parse_datetime_text(published)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def parse_datetime_text(value: str) -> datetime:
+    # RSS pubDate (RFC 822), then Atom updated (ISO 8601), then the generic parser as a last resort.
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return date_parser.parse(value)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+def build_http_session(pool_connections: int = 32, pool_maxsize: int = 64) -> requests.Session:
+    # Transient upstream errors are retried with backoff (0.5s, 1s, 2s). Once retries run out the
+    # last response is returned, so callers still see it through raise_for_status().
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Default for scrapers that are not handed a session, so repeated fetches reuse pooled keep-alive connections.
+HTTP_SESSION = build_http_session()
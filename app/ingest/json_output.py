@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, TextIO
+
+# orjson encodes in native code and returns UTF-8 bytes; the stdlib encoder is the fallback.
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+def write_json(payload: Any, stream: TextIO | None = None) -> None:
+    stream = stream or sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Text already printed to the stream must go out before the raw bytes.
+        stream.flush()
+        buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+
+    json.dump(payload, stream, indent=2, ensure_ascii=False)
+    stream.write("\n")
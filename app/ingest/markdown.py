@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import threading
+
+from docling.document_converter import DocumentConverter
+
+MARKDOWN_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_local = threading.local()
+
+
+def get_document_converter() -> DocumentConverter:
+    # Building a converter loads Docling's pipelines, so reuse it. It is not documented as
+    # thread-safe, so each worker thread gets its own instance.
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        converter = _local.converter = DocumentConverter()
+    return converter
+
+
+def fetch_article_markdown(url: str) -> str:
+    result = get_document_converter().convert(url, headers=MARKDOWN_REQUEST_HEADERS)
+    return result.document.export_to_markdown()
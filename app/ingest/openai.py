@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Sequence
+from itertools import islice
+from typing import Iterator, Sequence
 
 import feedparser
-import requests
-from dateutil import parser as date_parser
 from pydantic import BaseModel, Field
-from docling.document_converter import DocumentConverter
+import requests
+
+from app.ingest.feeds import entry_fields, iter_recent_entries, parse_entry_datetime, stream_feed_entries
+from app.ingest.markdown import fetch_article_markdown
 
 DEFAULT_OPENAI_RSS_URL = "https://openai.com/news/rss.xml"
 
@@ -21,69 +24,63 @@ class OpenAINewsArticleModel(BaseModel):
     categories: list[str] = Field(default_factory=list)
 
 
+# Plain container for the ingest path; pydantic validation is only paid when building OpenAINewsArticleModel.
+@dataclass(slots=True, frozen=True)
+class OpenAINewsEntry:
+    title: str
+    url: str
+    published_at: datetime
+    summary: str | None
+    guid: str | None
+    categories: list[str]
+
+
 class OpenAINewsScraper:
-    def __init__(self, rss_url: str = DEFAULT_OPENAI_RSS_URL, request_timeout_seconds: int = 15) -> None:
+    def __init__(
+        self,
+        rss_url: str = DEFAULT_OPENAI_RSS_URL,
+        request_timeout_seconds: int = 15,
+        session: requests.Session | None = None,
+    ) -> None:
         self.rss_url = rss_url
         self.request_timeout_seconds = request_timeout_seconds
+        self.session = session
 
-    def fetch_feed(self) -> feedparser.FeedParserDict:
-        response = requests.get(self.rss_url, timeout=self.request_timeout_seconds)
-        response.raise_for_status()
-        return feedparser.parse(response.content)
+    def fetch_feed_entries(self) -> Iterator[feedparser.FeedParserDict]:
+        return stream_feed_entries(self.rss_url, timeout=self.request_timeout_seconds, session=self.session)
 
     def collect_recent_articles(
         self,
         lookback_hours: int = 24,
         max_articles: int | None = None,
+        assume_sorted: bool = True,
     ) -> list[OpenAINewsArticleModel]:
+        entries = self.collect_recent_entries(
+            lookback_hours=lookback_hours,
+            max_articles=max_articles,
+            assume_sorted=assume_sorted,
+        )
+        return [OpenAINewsArticleModel.model_validate(entry, from_attributes=True) for entry in entries]
+
+    def collect_recent_entries(
+        self,
+        lookback_hours: int = 24,
+        max_articles: int | None = None,
+        assume_sorted: bool = True,
+    ) -> list[OpenAINewsEntry]:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-        feed = self.fetch_feed()
-
-        articles: list[OpenAINewsArticleModel] = []
-        for entry in feed.entries:
-            published_at = self.parse_entry_datetime(entry)
-            if published_at is None or published_at < cutoff:
-                continue
-
-            category_terms = [tag.term for tag in entry.get("tags", []) if getattr(tag, "term", None)]
-            article = OpenAINewsArticleModel(
-                title=(entry.get("title") or "").strip(),
-                url=(entry.get("link") or "").strip(),
-                published_at=published_at,
-                summary=(entry.get("description") or "").strip() or None,
-                guid=(entry.get("id") or entry.get("guid") or "").strip() or None,
-                categories=category_terms,
-            )
-            articles.append(article)
-
-            if max_articles is not None and len(articles) >= max_articles:
-                break
-
-        return articles
+        recent = iter_recent_entries(self.fetch_feed_entries(), cutoff, assume_sorted)
+        return [
+            OpenAINewsEntry(published_at=published_at, **entry_fields(entry))
+            for entry, published_at in islice(recent, max_articles)
+        ]
 
     def fetch_article_markdown(self, url: str) -> str:
-        converter = DocumentConverter()
-        result = converter.convert(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
-        return result.document.export_to_markdown()
+        return fetch_article_markdown(url)
 
     @staticmethod
     def parse_entry_datetime(entry: feedparser.FeedParserDict) -> datetime | None:
-        published = entry.get("published") or entry.get("updated")
-        if not published:
-            return None
-
-        dt = date_parser.parse(published)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return parse_entry_datetime(entry)
 
 
 DEFAULT_OPENAI_SCRAPER = OpenAINewsScraper()
@@ -94,12 +91,14 @@ def collect_recent_openai_articles(
     max_articles: int | None = None,
     rss_url: str = DEFAULT_OPENAI_RSS_URL,
     request_timeout_seconds: int = 15,
+    session: requests.Session | None = None,
 ) -> list[OpenAINewsArticleModel]:
     scraper = (
         DEFAULT_OPENAI_SCRAPER
-        if rss_url == DEFAULT_OPENAI_SCRAPER.rss_url
+        if session is None
+        and rss_url == DEFAULT_OPENAI_SCRAPER.rss_url
         and request_timeout_seconds == DEFAULT_OPENAI_SCRAPER.request_timeout_seconds
-        else OpenAINewsScraper(rss_url=rss_url, request_timeout_seconds=request_timeout_seconds)
+        else OpenAINewsScraper(rss_url=rss_url, request_timeout_seconds=request_timeout_seconds, session=session)
     )
     return scraper.collect_recent_articles(
         lookback_hours=lookback_hours,
@@ -1,110 +1,239 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping, Sequence
+
+import requests
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.db import SessionLocal, init_db
 from app.ingest.anthropic import AnthropicScraper
 from app.ingest.openai import OpenAINewsScraper
-from app.ingest.youtube import YouTubeSurfaceScraper
+from app.ingest.youtube import (
+    DEFAULT_CHANNEL_WORKERS,
+    DEFAULT_TRANSCRIPT_WORKERS,
+    ChannelResult,
+    YouTubeSurfaceScraper,
+)
 from app.db.models import Article, YoutubeChannel
 
+DEFAULT_MARKDOWN_WORKERS = 4
+
 
 def run_ingest(
     lookback_hours: int = 24,
     fetch_markdown: bool = False,
+    http_session: requests.Session | None = None,
+    concurrency: int | None = None,
 ) -> dict:
+    # concurrency caps the worker threads of each source's own fan-out; None keeps their defaults.
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f"concurrency must be a positive integer, got {concurrency}")
+    channel_workers = concurrency or DEFAULT_CHANNEL_WORKERS
+    transcript_workers = concurrency or DEFAULT_TRANSCRIPT_WORKERS
+    markdown_workers = concurrency or DEFAULT_MARKDOWN_WORKERS
     init_db()
-    session = SessionLocal()
-    try:
-        inserted = 0
+    with SessionLocal() as session:
+        channels = list_active_channels(session)
+
+    # Sources are independent network calls; collect them concurrently and keep DB writes on this thread.
+    # No transaction is held open while the scrapers run.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        youtube_future = executor.submit(
+            collect_youtube_results,
+            channels,
+            lookback_hours,
+            http_session,
+            max_workers=channel_workers,
+            transcript_workers=transcript_workers,
+        )
+        futures = [
+            executor.submit(
+                collect_openai_rows, lookback_hours, fetch_markdown, http_session, max_workers=markdown_workers
+            ),
+            executor.submit(
+                collect_anthropic_rows, lookback_hours, fetch_markdown, http_session, max_workers=markdown_workers
+            ),
+        ]
+        youtube_results = youtube_future.result()
+        rows = youtube_rows(youtube_results) + [row for future in futures for row in future.result()]
+
+    with SessionLocal.begin() as session:
+        inserted = insert_new_articles(session, rows)
+        save_resolved_channel_ids(session, channels, youtube_results)
+    return {"inserted": inserted}
 
-        inserted += ingest_youtube(session, lookback_hours)
-        inserted += ingest_openai(session, lookback_hours, fetch_markdown=fetch_markdown)
-        inserted += ingest_anthropic(session, lookback_hours, fetch_markdown=fetch_markdown)
 
-        session.commit()
-        return {"inserted": inserted}
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+def ingest_youtube(session: Session, lookback_hours: int, http_session: requests.Session | None = None) -> int:
+    channels = list_active_channels(session)
+    results = collect_youtube_results(channels, lookback_hours, http_session)
+    save_resolved_channel_ids(session, channels, results)
+    return insert_new_articles(session, youtube_rows(results))
 
 
-def ingest_youtube(session: Session, lookback_hours: int) -> int:
-    channels = session.scalars(select(YoutubeChannel).where(YoutubeChannel.active.is_(True))).all()
+def ingest_openai(
+    session: Session,
+    lookback_hours: int,
+    fetch_markdown: bool,
+    http_session: requests.Session | None = None,
+) -> int:
+    rows = collect_openai_rows(lookback_hours, fetch_markdown, http_session)
+    return insert_new_articles(session, rows)
+
+
+def ingest_anthropic(
+    session: Session,
+    lookback_hours: int,
+    fetch_markdown: bool,
+    http_session: requests.Session | None = None,
+) -> int:
+    rows = collect_anthropic_rows(lookback_hours, fetch_markdown, http_session)
+    return insert_new_articles(session, rows)
+
+
+def list_active_channels(session: Session) -> dict[str, str | None]:
+    # Active channel inputs mapped to their stored channel ID (None until first resolved).
+    stmt = select(YoutubeChannel.channel_input, YoutubeChannel.channel_id).where(YoutubeChannel.active.is_(True))
+    return {channel_input: channel_id for channel_input, channel_id in session.execute(stmt)}
+
+
+def collect_youtube_results(
+    channels: Mapping[str, str | None],
+    lookback_hours: int,
+    http_session: requests.Session | None = None,
+    max_workers: int = DEFAULT_CHANNEL_WORKERS,
+    transcript_workers: int = DEFAULT_TRANSCRIPT_WORKERS,
+) -> list[ChannelResult]:
     if not channels:
+        return []
+
+    with YouTubeSurfaceScraper(session=http_session, transcript_workers=transcript_workers) as scraper:
+        # Stored IDs skip the HTML/oEmbed lookups; only new inputs are resolved over the network.
+        scraper.prime_channel_id_cache({key: value for key, value in channels.items() if value})
+        return scraper.collect_latest_videos(
+            channel_inputs=list(channels),
+            lookback_hours=lookback_hours,
+            include_transcripts=True,
+            max_workers=max_workers,
+        )
+
+
+def save_resolved_channel_ids(
+    session: Session,
+    channels: Mapping[str, str | None],
+    results: list[ChannelResult],
+) -> int:
+    rows = [
+        {"channel_input": result.channel_input, "channel_id": result.channel_id}
+        for result in results
+        if result.channel_id and channels.get(result.channel_input) != result.channel_id
+    ]
+    if not rows:
         return 0
 
-    scraper = YouTubeSurfaceScraper()
-    results = scraper.collect_latest_videos(
-        channel_inputs=[channel.channel_input for channel in channels],
-        lookback_hours=lookback_hours,
-        include_transcripts=True,
+    table = YoutubeChannel.__table__
+    stmt = pg_insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.channel_input],
+        set_={"channel_id": stmt.excluded.channel_id, "updated_at": func.now()},
     )
+    session.execute(stmt)
+    return len(rows)
 
-    inserted = 0
+
+def youtube_rows(results: list[ChannelResult]) -> list[dict]:
+    rows: list[dict] = []
     for result in results:
         for video in result.videos:
-            inserted += upsert_article(
-                session,
-                source_type="youtube",
-                source=video.channel_id,
-                title=video.title,
-                url=video.url,
-                video_id=video.video_id,
-                published_at=video.published_at,
-                summary=None,
-                raw_content=video.transcript.text if video.transcript else None,
+            rows.append(
+                {
+                    "source_type": "youtube",
+                    "source": video.channel_id,
+                    "title": video.title,
+                    "url": video.url,
+                    "video_id": video.video_id,
+                    "published_at": video.published_at,
+                    "summary": None,
+                    "raw_content": video.transcript.text if video.transcript else None,
+                }
             )
-    return inserted
-
-
-def ingest_openai(session: Session, lookback_hours: int, fetch_markdown: bool) -> int:
-    scraper = OpenAINewsScraper()
-    articles = scraper.collect_recent_articles(lookback_hours=lookback_hours)
-    inserted = 0
-
-    for article in articles:
-        raw_content = None
-        if fetch_markdown:
-            raw_content = scraper.fetch_article_markdown(article.url)
-
-        inserted += upsert_article(
-            session,
-            source_type="openai",
-            source="openai_news",
-            title=article.title,
-            url=article.url,
-            published_at=article.published_at,
-            summary=article.summary,
-            raw_content=raw_content,
-        )
-    return inserted
-
-
-def ingest_anthropic(session: Session, lookback_hours: int, fetch_markdown: bool) -> int:
-    scraper = AnthropicScraper()
-    articles = scraper.collect_recent_articles(lookback_hours=lookback_hours)
-    inserted = 0
-
-    for article in articles:
-        raw_content = None
-        if fetch_markdown:
-            raw_content = scraper.fetch_article_markdown(article.url)
-
-        inserted += upsert_article(
-            session,
-            source_type="anthropic",
-            source=article.feed_url or "anthropic",
-            title=article.title,
-            url=article.url,
-            published_at=article.published_at,
-            summary=article.summary,
-            raw_content=raw_content,
+    return rows
+
+
+def collect_openai_rows(
+    lookback_hours: int,
+    fetch_markdown: bool,
+    http_session: requests.Session | None = None,
+    max_workers: int = DEFAULT_MARKDOWN_WORKERS,
+) -> list[dict]:
+    scraper = OpenAINewsScraper(session=http_session)
+    articles = scraper.collect_recent_entries(lookback_hours=lookback_hours)
+    fetch_fn = scraper.fetch_article_markdown if fetch_markdown else None
+    return article_rows("openai", "openai_news", articles, fetch_fn, max_workers)
+
+
+def collect_anthropic_rows(
+    lookback_hours: int,
+    fetch_markdown: bool,
+    http_session: requests.Session | None = None,
+    max_workers: int = DEFAULT_MARKDOWN_WORKERS,
+) -> list[dict]:
+    scraper = AnthropicScraper(session=http_session)
+    articles = scraper.collect_recent_entries(lookback_hours=lookback_hours)
+    fetch_fn = scraper.fetch_article_markdown if fetch_markdown else None
+    return article_rows("anthropic", "anthropic", articles, fetch_fn, max_workers)
+
+
+def article_rows(
+    source_type: str,
+    default_source: str,
+    articles: Sequence,
+    fetch_fn=None,
+    max_workers: int = DEFAULT_MARKDOWN_WORKERS,
+) -> list[dict]:
+    if fetch_fn is not None:
+        bodies: list[str | None] = fetch_markdown_bodies(fetch_fn, articles, max_workers)
+    else:
+        bodies = [None] * len(articles)
+
+    rows: list[dict] = []
+    for article, raw_content in zip(articles, bodies):
+        rows.append(
+            {
+                "source_type": source_type,
+                # Anthropic entries record the feed they came from; OpenAI has a single feed.
+                "source": getattr(article, "feed_url", None) or default_source,
+                "title": article.title,
+                "url": article.url,
+                "video_id": None,
+                "published_at": article.published_at,
+                "summary": article.summary,
+                "raw_content": raw_content,
+            }
         )
-    return inserted
+    return rows
+
+
+def fetch_markdown_bodies(fetch_fn, articles: Sequence, max_workers: int = DEFAULT_MARKDOWN_WORKERS) -> list[str]:
+    if not articles:
+        return []
+
+    # Each article page is an independent download + conversion; map keeps results in article order.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(articles))) as executor:
+        return list(executor.map(fetch_fn, [article.url for article in articles]))
+
+
+def insert_new_articles(session: Session, rows: list[dict]) -> int:
+    if not rows:
+        return 0
+
+    # The unique constraints on url and (source_type, video_id) do the dedup, including within the batch.
+    # Core insert against the table skips ORM unit-of-work bookkeeping for rows we never read back.
+    table = Article.__table__
+    stmt = pg_insert(table).values(rows).on_conflict_do_nothing().returning(table.c.id)
+    return len(session.execute(stmt).all())
 
 
 def upsert_article(
@@ -119,24 +248,18 @@ def upsert_article(
     summary: str | None,
     raw_content: str | None,
 ) -> int:
-    existing = session.scalar(select(Article).where(Article.url == url))
-    if not existing and source_type == "youtube" and video_id:
-        existing = session.scalar(
-            select(Article).where(Article.source_type == "youtube", Article.video_id == video_id)
-        )
-    if existing:
-        return 0
-
-    session.add(
-        Article(
-            source_type=source_type,
-            source=source,
-            title=title,
-            url=url,
-            video_id=video_id,
-            published_at=published_at,
-            summary=summary,
-            raw_content=raw_content,
-        )
+    return insert_new_articles(
+        session,
+        [
+            {
+                "source_type": source_type,
+                "source": source,
+                "title": title,
+                "url": url,
+                "video_id": video_id,
+                "published_at": published_at,
+                "summary": summary,
+                "raw_content": raw_content,
+            }
+        ],
     )
-    return 1
@@ -1,24 +1,58 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from io import StringIO
+import json
 import re
-from typing import Iterable, Sequence
-from urllib.parse import parse_qs, quote, urlparse
+import threading
+import time
+from typing import Iterable, Mapping, Sequence
+from urllib.parse import quote, urlparse
 
 import feedparser
-import requests
 from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
 from pydantic import BaseModel
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+from app.ingest.disk_cache import (
+    TRANSCRIPT_ABSENT_CACHE_FILE,
+    load_transcript_absent_cache,
+    save_transcript_absent_cache,
+)
+from app.ingest.feeds import iter_recent_entries, parse_entry_datetime
+from app.ingest.http_client import build_http_session
+
+# Resolved once at import: older youtube-transcript-api versions expose get_transcript(...),
+# newer versions use instance.fetch(...) on an instance built by get_transcript_api().
+try:
+    from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi
+except ModuleNotFoundError:
+    YouTubeTranscriptApi = None
+_TRANSCRIPT_AVAILABLE = YouTubeTranscriptApi is not None
+# Errors meaning the video has no captions at all, as opposed to a failed request.
+_TRANSCRIPT_ABSENT_ERRORS: tuple[type[Exception], ...] = (
+    (NoTranscriptFound, TranscriptsDisabled) if _TRANSCRIPT_AVAILABLE else ()
+)
+_HAS_GET_TRANSCRIPT = _TRANSCRIPT_AVAILABLE and hasattr(YouTubeTranscriptApi, "get_transcript")
+_local = threading.local()
 
 YOUTUBE_FEED_BASE = "https://www.youtube.com/feeds/videos.xml?channel_id="
 YOUTUBE_URL = "https://www.youtube.com"
 CHANNEL_ID_PATTERN = re.compile(r"^UC[a-zA-Z0-9_-]{22}$")
-CHANNEL_ID_IN_HTML_PATTERN = re.compile(r'"channelId":"(UC[a-zA-Z0-9_-]{22})"')
-EXTERNAL_ID_IN_HTML_PATTERN = re.compile(r'"externalId":"(UC[a-zA-Z0-9_-]{22})"')
-BROWSE_ID_IN_HTML_PATTERN = re.compile(r'"browseId":"(UC[a-zA-Z0-9_-]{22})"')
-VIDEO_ID_IN_URL_PATTERN = re.compile(r"(?:v=|/videos/|/embed/|youtu\.be/)([a-zA-Z0-9_-]{11})")
+# Channel pages are matched as raw bytes so the multi-MB body is never decoded to str.
+META_CHANNEL_ID_PATTERN = re.compile(rb'<meta itemprop="channelId" content="(UC[a-zA-Z0-9_-]{22})"')
+CANONICAL_CHANNEL_ID_PATTERN = re.compile(
+    rb'<link rel="canonical" href="https://www\.youtube\.com/channel/(UC[a-zA-Z0-9_-]{22})"'
+)
+YT_INITIAL_DATA_PATTERN = re.compile(rb'ytInitialData"?\]?\s*=\s*(?=\{)')
+UC_ID_IN_HTML_PATTERN = re.compile(rb'"(?:channelId|externalId|browseId)":"(UC[a-zA-Z0-9_-]{22})"')
+# A "#" after whitespace (space or tab) starts a trailing comment in the channels file.
+INLINE_COMMENT_PATTERN = re.compile(r"\s#")
+VIDEO_ID_IN_URL_PATTERN = re.compile(r"(?:[?&]v=|/videos/|/embed/|youtu\.be/)([a-zA-Z0-9_-]{11})")
+_JSON_DECODER = json.JSONDecoder()
 DEFAULT_YOUTUBE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -26,9 +60,22 @@ DEFAULT_YOUTUBE_HEADERS = {
         "Chrome/131.0.0.0 Safari/537.36"
     ),
     "Accept-Language": "en-US,en;q=0.9",
+    # urllib3's list adds "br" only when a Brotli decoder is importable, so it never asks for an encoding
+    # it cannot decode. Channel pages are a few MB of HTML and compress far better with Brotli than gzip.
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 # Helps bypass the consent interstitial that can block channel ID extraction.
 DEFAULT_YOUTUBE_COOKIES = {"CONSENT": "YES+", "SOCS": "CAI"}
+DEFAULT_CHANNEL_WORKERS = 8
+# How long a video without captions is skipped. Auto-generated captions can take a day or more to
+# show up, so videos younger than TRANSCRIPT_ABSENT_MIN_AGE (or of unknown age) are only skipped briefly:
+# enough to spare back-to-back runs the request without holding off enrich's backfill for days.
+TRANSCRIPT_ABSENT_TTL_SECONDS = 7 * 24 * 60 * 60
+TRANSCRIPT_ABSENT_RECENT_TTL_SECONDS = 6 * 60 * 60
+TRANSCRIPT_ABSENT_MIN_AGE = timedelta(hours=72)
+MISSING_TRANSCRIPT_DEPENDENCY_ERROR = "Missing dependency: youtube-transcript-api"
+TRANSCRIPT_ABSENT_ERROR = "No transcript available (cached)."
+DEFAULT_TRANSCRIPT_WORKERS = 8
 
 
 @dataclass(slots=True)
@@ -61,22 +108,62 @@ class YouTubeSurfaceScraper:
         default_transcript_languages: Sequence[str] = ("en", "en-US"),
         headers: dict[str, str] | None = None,
         cookies: dict[str, str] | None = None,
+        session: requests.Session | None = None,
+        transcript_absent_cache_file: str = TRANSCRIPT_ABSENT_CACHE_FILE,
+        transcript_workers: int = DEFAULT_TRANSCRIPT_WORKERS,
     ) -> None:
+        if transcript_workers < 1:
+            raise ValueError(f"transcript_workers must be a positive integer, got {transcript_workers}")
         self.request_timeout_seconds = request_timeout_seconds
         self.default_transcript_languages = list(default_transcript_languages)
         self.headers = headers or DEFAULT_YOUTUBE_HEADERS
         self.cookies = cookies or DEFAULT_YOUTUBE_COOKIES
+        # Every request goes to youtube.com, so one keep-alive session saves a TCP+TLS handshake per call.
+        # A session passed in is shared with other scrapers: it is not closed here, and the YouTube
+        # headers/cookies are sent per request instead of being set on it.
+        self._owns_session = session is None
+        self._session = session or build_http_session(pool_connections=16, pool_maxsize=32)
+        self._channel_id_cache: dict[str, str] = {}
+        # Loaded on first use; entries added during this run are written back on close().
+        self.transcript_absent_cache_file = transcript_absent_cache_file
+        self._transcript_absent: dict[str, float] | None = None
+        self._transcript_absent_added: dict[str, float] = {}
+        self._transcript_absent_lock = threading.Lock()
+        # Caps transcript requests in flight, including fetch_transcript calls from a caller's own threads;
+        # a burst of them is what gets YouTube to start answering with RequestBlocked.
+        self.transcript_workers = transcript_workers
+        self._transcript_slots = threading.BoundedSemaphore(transcript_workers)
+        # One transcript pool shared by all channel workers, created on first use.
+        self._transcript_executor: ThreadPoolExecutor | None = None
+        self._transcript_executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        self.save_transcript_absent_cache()
+        with self._transcript_executor_lock:
+            executor, self._transcript_executor = self._transcript_executor, None
+        if executor is not None:
+            executor.shutdown()
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> YouTubeSurfaceScraper:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     @staticmethod
     def load_channel_inputs(path: str) -> list[str]:
-        channels: list[str] = []
         with open(path, "r", encoding="utf-8") as file:
-            for line in file:
-                cleaned = line.strip()
-                if not cleaned or cleaned.startswith("#"):
-                    continue
-                channels.append(cleaned)
-        return channels
+            content = file.read()
+        # Stripped, without comments (full-line, or "#" after any whitespace), and de-duplicated in file order.
+        return list(
+            dict.fromkeys(
+                cleaned
+                for cleaned in (INLINE_COMMENT_PATTERN.split(line, 1)[0].strip() for line in content.splitlines())
+                if cleaned and not cleaned.startswith("#")
+            )
+        )
 
     def collect_latest_videos(
         self,
@@ -85,33 +172,55 @@ class YouTubeSurfaceScraper:
         include_transcripts: bool = True,
         transcript_languages: Sequence[str] | None = None,
         max_videos_per_channel: int | None = None,
+        max_workers: int = DEFAULT_CHANNEL_WORKERS,
     ) -> list[ChannelResult]:
-        results: list[ChannelResult] = []
+        if not channel_inputs:
+            return []
+
         cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
         languages = list(transcript_languages or self.default_transcript_languages)
 
-        for channel_input in channel_inputs:
-            try:
-                channel_id = self.resolve_channel_id(channel_input)
-                videos = self.fetch_recent_videos_from_channel_id(
-                    channel_input=channel_input,
-                    channel_id=channel_id,
-                    cutoff_utc=cutoff,
-                    include_transcripts=include_transcripts,
-                    transcript_languages=languages,
-                    max_videos=max_videos_per_channel,
-                )
-                results.append(ChannelResult(channel_input=channel_input, channel_id=channel_id, videos=videos, error=None))
-            except Exception as exc:  # noqa: BLE001
-                results.append(
-                    ChannelResult(
+        # Channels are independent chains of network calls, so they run side by side; map keeps input order.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(channel_inputs))) as executor:
+            return list(
+                executor.map(
+                    lambda channel_input: self.collect_channel(
                         channel_input=channel_input,
-                        channel_id=None,
-                        videos=[],
-                        error=str(exc),
-                    )
+                        cutoff_utc=cutoff,
+                        include_transcripts=include_transcripts,
+                        transcript_languages=languages,
+                        max_videos=max_videos_per_channel,
+                    ),
+                    channel_inputs,
                 )
-        return results
+            )
+
+    def collect_channel(
+        self,
+        channel_input: str,
+        cutoff_utc: datetime,
+        include_transcripts: bool,
+        transcript_languages: Sequence[str],
+        max_videos: int | None = None,
+    ) -> ChannelResult:
+        try:
+            channel_id = self.resolve_channel_id(channel_input)
+            videos = self.fetch_recent_videos_from_channel_id(
+                channel_input=channel_input,
+                channel_id=channel_id,
+                cutoff_utc=cutoff_utc,
+                include_transcripts=include_transcripts,
+                transcript_languages=transcript_languages,
+                max_videos=max_videos,
+            )
+            return ChannelResult(channel_input=channel_input, channel_id=channel_id, videos=videos, error=None)
+        except Exception as exc:  # noqa: BLE001
+            return ChannelResult(
+                channel_input=channel_input,
+                channel_id=None,
+                videos=[],
+                error=str(exc),
+            )
 
     def fetch_recent_videos_from_channel_id(
         self,
@@ -123,47 +232,79 @@ class YouTubeSurfaceScraper:
         max_videos: int | None = None,
     ) -> list[YouTubeVideoModel]:
         feed_url = f"{YOUTUBE_FEED_BASE}{channel_id}"
-        feed = feedparser.parse(feed_url)
-        videos: list[YouTubeVideoModel] = []
-
-        for entry in feed.entries:
-            published_at = self.parse_entry_datetime(entry)
-            if published_at is None or published_at < cutoff_utc:
-                continue
+        # Fetched on the scraper's pooled session rather than feedparser's own urllib request.
+        response = self._get(feed_url)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        candidates: list[tuple[feedparser.FeedParserDict, datetime, str]] = []
 
-            video_url = entry.get("link", "")
-            video_id = entry.get("yt_videoid") or self.extract_video_id(video_url)
+        # YouTube feeds list uploads newest first, so the shared cutoff rule ends the scan early.
+        for entry, published_at in iter_recent_entries(feed.entries, cutoff_utc):
+            video_id = entry.get("yt_videoid") or self.extract_video_id(entry.get("link", ""))
             if not video_id:
                 continue
 
-            transcript = None
-            transcript_error = None
-            if include_transcripts:
-                transcript, transcript_error = self.get_video_transcript(video_id, transcript_languages)
-
-            videos.append(
-                YouTubeVideoModel(
-                    channel_input=channel_input,
-                    channel_id=channel_id,
-                    video_id=video_id,
-                    title=entry.get("title", "").strip(),
-                    url=video_url,
-                    published_at=published_at,
-                    transcript=transcript,
-                    transcript_error=transcript_error,
+            candidates.append((entry, published_at, video_id))
+            if max_videos is not None and len(candidates) >= max_videos:
+                break
+
+        transcripts: list[tuple[TranscriptModel | None, str | None]] = [(None, None)] * len(candidates)
+        if include_transcripts and candidates:
+            # Transcript requests are independent round-trips, so they overlap instead of running back to back.
+            # Every channel submits to the same pool, so transcript_workers bounds them across channels.
+            transcripts = list(
+                self._transcript_pool().map(
+                    lambda candidate: self.fetch_transcript(
+                        candidate[2], transcript_languages, published_at=candidate[1]
+                    ),
+                    candidates,
                 )
             )
 
-            if max_videos is not None and len(videos) >= max_videos:
-                break
+        return [
+            YouTubeVideoModel(
+                channel_input=channel_input,
+                channel_id=channel_id,
+                video_id=video_id,
+                title=entry.get("title", "").strip(),
+                url=entry.get("link", ""),
+                published_at=published_at,
+                transcript=transcript,
+                transcript_error=transcript_error,
+            )
+            for (entry, published_at, video_id), (transcript, transcript_error) in zip(candidates, transcripts)
+        ]
 
-        return videos
+    def _transcript_pool(self) -> ThreadPoolExecutor:
+        with self._transcript_executor_lock:
+            if self._transcript_executor is None:
+                self._transcript_executor = ThreadPoolExecutor(max_workers=self.transcript_workers)
+            return self._transcript_executor
 
     def resolve_channel_id(self, channel_input: str) -> str:
         normalized = channel_input.strip()
         if not normalized:
             raise ValueError("Channel input is empty.")
 
+        # Channel IDs never change for a given handle/URL, so each input is resolved once per scraper.
+        cached = self._channel_id_cache.get(normalized)
+        if cached:
+            return cached
+
+        channel_id = self._resolve_channel_id_uncached(normalized, channel_input)
+        self._channel_id_cache[normalized] = channel_id
+        return channel_id
+
+    def prime_channel_id_cache(self, channel_ids: Mapping[str, str]) -> None:
+        for channel_input, channel_id in channel_ids.items():
+            normalized = channel_input.strip()
+            if normalized and channel_id:
+                self._channel_id_cache[normalized] = channel_id
+
+    def clear_channel_id_cache(self) -> None:
+        self._channel_id_cache.clear()
+
+    def _resolve_channel_id_uncached(self, normalized: str, channel_input: str) -> str:
         direct = self.try_extract_channel_id_from_text(normalized)
         if direct:
             return direct
@@ -191,13 +332,16 @@ class YouTubeSurfaceScraper:
 
     @staticmethod
     def to_channel_url(channel_input: str) -> str:
-        parsed = urlparse(channel_input)
-        if parsed.scheme and parsed.netloc:
+        if channel_input.startswith(("http://", "https://")):
             return channel_input
         if channel_input.startswith("@"):
             return f"{YOUTUBE_URL}/{channel_input}"
         if channel_input.startswith("youtube.com/"):
             return f"https://{channel_input}"
+        # The prefix checks are case-sensitive; anything else urlparse sees as absolute (e.g. "HTTPS://...") is kept.
+        parsed = urlparse(channel_input)
+        if parsed.scheme and parsed.netloc:
+            return channel_input
         raise ValueError(
             f"Unsupported channel input '{channel_input}'. "
             "Expected channel ID, URL, or @handle."
@@ -207,6 +351,9 @@ class YouTubeSurfaceScraper:
     def try_extract_channel_id_from_text(text: str) -> str | None:
         if CHANNEL_ID_PATTERN.fullmatch(text):
             return text
+        # Handles and custom URLs are the common input; only channel URLs are worth parsing.
+        if "channel/" not in text:
+            return None
 
         parsed = urlparse(text)
         path = parsed.path.strip("/")
@@ -217,7 +364,25 @@ class YouTubeSurfaceScraper:
         return None
 
     @staticmethod
-    def extract_channel_id_from_html(html: str) -> str | None:
+    def extract_channel_id_from_html(html: bytes) -> str | None:
+        # Precompiled regexes find the ID on virtually every page; building a BeautifulSoup tree of a
+        # multi-megabyte channel page is only worth it when they all miss.
+        for pattern in (META_CHANNEL_ID_PATTERN, CANONICAL_CHANNEL_ID_PATTERN):
+            match = pattern.search(html)
+            if match:
+                return match.group(1).decode("ascii")
+
+        # The bare channelId/externalId/browseId keys can also belong to other channels linked from the
+        # page, so the owner's ID is read from the embedded ytInitialData JSON before grepping for them.
+        extracted = YouTubeSurfaceScraper.extract_channel_id_from_initial_data(html)
+        if extracted:
+            return extracted
+
+        # One scan for whichever ID key appears first.
+        match = UC_ID_IN_HTML_PATTERN.search(html)
+        if match:
+            return match.group(1).decode("ascii")
+
         soup = BeautifulSoup(html, "html.parser")
         meta = soup.find("meta", attrs={"itemprop": "channelId"})
         if meta and meta.get("content") and CHANNEL_ID_PATTERN.fullmatch(meta["content"]):
@@ -228,28 +393,32 @@ class YouTubeSurfaceScraper:
             extracted = YouTubeSurfaceScraper.try_extract_channel_id_from_text(canonical["href"])
             if extracted:
                 return extracted
+        return None
 
-        match = CHANNEL_ID_IN_HTML_PATTERN.search(html)
-        if match:
-            return match.group(1)
+    @staticmethod
+    def extract_channel_id_from_initial_data(html: bytes) -> str | None:
+        match = YT_INITIAL_DATA_PATTERN.search(html)
+        if not match:
+            return None
 
-        match = EXTERNAL_ID_IN_HTML_PATTERN.search(html)
-        if match:
-            return match.group(1)
+        # raw_decode stops at the end of the object, so no regex has to find where the blob ends.
+        # Only the page from the blob onwards is decoded.
+        try:
+            data, _ = _JSON_DECODER.raw_decode(html[match.end() :].decode("utf-8", errors="replace"))
+        except ValueError:
+            return None
 
-        match = BROWSE_ID_IN_HTML_PATTERN.search(html)
-        if match:
-            return match.group(1)
+        try:
+            channel_id = data["metadata"]["channelMetadataRenderer"]["externalId"]
+        except (KeyError, TypeError):
+            return None
+        if isinstance(channel_id, str) and CHANNEL_ID_PATTERN.fullmatch(channel_id):
+            return channel_id
         return None
 
     def extract_channel_id_from_oembed(self, channel_url: str) -> str | None:
         endpoint = f"https://www.youtube.com/oembed?url={quote(channel_url, safe='')}&format=json"
-        response = requests.get(
-            endpoint,
-            timeout=self.request_timeout_seconds,
-            headers=self.headers,
-            cookies=self.cookies,
-        )
+        response = self._get(endpoint)
         if response.status_code != 200:
             return None
 
@@ -260,36 +429,28 @@ class YouTubeSurfaceScraper:
 
         return self.try_extract_channel_id_from_text(author_url)
 
-    def get_youtube_html(self, url: str) -> str:
-        response = requests.get(
+    def get_youtube_html(self, url: str) -> bytes:
+        response = self._get(url)
+        response.raise_for_status()
+        return response.content
+
+    def _get(self, url: str) -> requests.Response:
+        return self._session.get(
             url,
-            timeout=self.request_timeout_seconds,
             headers=self.headers,
             cookies=self.cookies,
+            timeout=self.request_timeout_seconds,
         )
-        response.raise_for_status()
-        return response.text
 
     @staticmethod
     def parse_entry_datetime(entry: feedparser.FeedParserDict) -> datetime | None:
-        published = entry.get("published") or entry.get("updated")
-        if not published:
-            return None
-        dt = date_parser.parse(published)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return parse_entry_datetime(entry)
 
     @staticmethod
     def extract_video_id(video_url: str) -> str | None:
         if not video_url:
             return None
 
-        parsed = urlparse(video_url)
-        query = parse_qs(parsed.query)
-        if "v" in query and query["v"]:
-            return query["v"][0]
-
         match = VIDEO_ID_IN_URL_PATTERN.search(video_url)
         if match:
             return match.group(1)
@@ -299,45 +460,55 @@ class YouTubeSurfaceScraper:
     def get_video_transcript(
         video_id: str, transcript_languages: Iterable[str]
     ) -> tuple[TranscriptModel | None, str | None]:
-        try:
-            from youtube_transcript_api import YouTubeTranscriptApi
+        if not _TRANSCRIPT_AVAILABLE:
+            return None, MISSING_TRANSCRIPT_DEPENDENCY_ERROR
 
-            languages = list(transcript_languages)
+        try:
+            text = _fetch_transcript_text(video_id, list(transcript_languages))
+            return YouTubeSurfaceScraper.to_transcript_model(text), None
+        except Exception as exc:  # noqa: BLE001
+            return None, str(exc)
 
-            # Compatibility across youtube-transcript-api versions:
-            # older versions expose get_transcript(...), newer versions use instance.fetch(...).
-            if hasattr(YouTubeTranscriptApi, "get_transcript"):
-                chunks = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
-                text = " ".join(part.get("text", "").strip() for part in chunks if part.get("text")).strip()
-                return YouTubeSurfaceScraper.to_transcript_model(text), None
+    def fetch_transcript(
+        self,
+        video_id: str,
+        transcript_languages: Iterable[str],
+        published_at: datetime | None = None,
+    ) -> tuple[TranscriptModel | None, str | None]:
+        # Like get_video_transcript, but skips videos recently found to have no captions and records new ones.
+        # Recent videos (or a missing published_at) are skipped for TRANSCRIPT_ABSENT_RECENT_TTL_SECONDS only.
+        if not _TRANSCRIPT_AVAILABLE:
+            return None, MISSING_TRANSCRIPT_DEPENDENCY_ERROR
+        now = time.time()
+        if self._known_absent_transcripts().get(video_id, 0) > now:
+            return None, TRANSCRIPT_ABSENT_ERROR
 
-            api = YouTubeTranscriptApi()
-            try:
-                fetched = api.fetch(video_id, languages=languages)
-                text_parts = [snippet.text.strip() for snippet in fetched if getattr(snippet, "text", "").strip()]
-                text = " ".join(text_parts).strip()
-                return YouTubeSurfaceScraper.to_transcript_model(text), None
-            except Exception as preferred_error:  # noqa: BLE001
-                # Fallback: if preferred languages are missing, use first available transcript.
-                transcript_list = api.list(video_id)
-                transcripts = list(transcript_list)
-                transcripts.sort(key=lambda transcript: transcript.is_generated)
-
-                for transcript in transcripts:
-                    try:
-                        fetched = transcript.fetch()
-                        text_parts = [snippet.text.strip() for snippet in fetched if getattr(snippet, "text", "").strip()]
-                        text = " ".join(text_parts).strip()
-                        if text:
-                            return YouTubeSurfaceScraper.to_transcript_model(text), None
-                    except Exception:  # noqa: BLE001
-                        continue
-
-                return None, str(preferred_error)
-        except ModuleNotFoundError:
-            return None, "Missing dependency: youtube-transcript-api"
+        try:
+            with self._transcript_slots:
+                text = _fetch_transcript_text(video_id, list(transcript_languages))
+        except _TRANSCRIPT_ABSENT_ERRORS as exc:
+            if _older_than(published_at, TRANSCRIPT_ABSENT_MIN_AGE):
+                skip_until = now + TRANSCRIPT_ABSENT_TTL_SECONDS
+            else:
+                skip_until = now + TRANSCRIPT_ABSENT_RECENT_TTL_SECONDS
+            with self._transcript_absent_lock:
+                self._transcript_absent[video_id] = self._transcript_absent_added[video_id] = skip_until
+            return None, str(exc)
         except Exception as exc:  # noqa: BLE001
             return None, str(exc)
+        return self.to_transcript_model(text), None
+
+    def save_transcript_absent_cache(self) -> None:
+        # Writes the videos recorded since the last save; close() calls this too.
+        with self._transcript_absent_lock:
+            added, self._transcript_absent_added = self._transcript_absent_added, {}
+        save_transcript_absent_cache(added, self.transcript_absent_cache_file)
+
+    def _known_absent_transcripts(self) -> dict[str, float]:
+        with self._transcript_absent_lock:
+            if self._transcript_absent is None:
+                self._transcript_absent = load_transcript_absent_cache(self.transcript_absent_cache_file)
+            return self._transcript_absent
 
     @staticmethod
     def to_transcript_model(transcript_text: str | None) -> TranscriptModel | None:
@@ -355,9 +526,21 @@ class YouTubeSurfaceScraper:
                 "error": result.error,
                 "videos": [],
             }
+            # Built by hand instead of model_dump(mode="json"): the models are flat, and the
+            # field-by-field validation/serialization pass is the bulk of the cost for large runs.
             for video in result.videos:
-                video_dict = video.model_dump(mode="json")
-                item["videos"].append(video_dict)
+                item["videos"].append(
+                    {
+                        "channel_input": video.channel_input,
+                        "channel_id": video.channel_id,
+                        "video_id": video.video_id,
+                        "title": video.title,
+                        "url": video.url,
+                        "published_at": _isoformat_utc(video.published_at),
+                        "transcript": {"text": video.transcript.text} if video.transcript else None,
+                        "transcript_error": video.transcript_error,
+                    }
+                )
             payload.append(item)
         return payload
 
@@ -376,20 +559,101 @@ def collect_latest_videos(
     transcript_languages: Sequence[str] | None = None,
     max_videos_per_channel: int | None = None,
     request_timeout_seconds: int = 15,
+    max_workers: int = DEFAULT_CHANNEL_WORKERS,
+    session: requests.Session | None = None,
+    transcript_workers: int = DEFAULT_TRANSCRIPT_WORKERS,
 ) -> list[ChannelResult]:
     scraper = (
         DEFAULT_SCRAPER
-        if request_timeout_seconds == DEFAULT_SCRAPER.request_timeout_seconds
-        else YouTubeSurfaceScraper(request_timeout_seconds=request_timeout_seconds)
-    )
-    return scraper.collect_latest_videos(
-        channel_inputs=channel_inputs,
-        lookback_hours=lookback_hours,
-        include_transcripts=include_transcripts,
-        transcript_languages=transcript_languages,
-        max_videos_per_channel=max_videos_per_channel,
+        if session is None
+        and request_timeout_seconds == DEFAULT_SCRAPER.request_timeout_seconds
+        and transcript_workers == DEFAULT_SCRAPER.transcript_workers
+        else YouTubeSurfaceScraper(
+            request_timeout_seconds=request_timeout_seconds,
+            session=session,
+            transcript_workers=transcript_workers,
+        )
     )
+    try:
+        return scraper.collect_latest_videos(
+            channel_inputs=channel_inputs,
+            lookback_hours=lookback_hours,
+            include_transcripts=include_transcripts,
+            transcript_languages=transcript_languages,
+            max_videos_per_channel=max_videos_per_channel,
+            max_workers=max_workers,
+        )
+    finally:
+        # A one-off scraper's transcript pool and session are not reused, so they are released here.
+        # DEFAULT_SCRAPER stays open, but the videos it found without captions are still saved.
+        if scraper is not DEFAULT_SCRAPER:
+            scraper.close()
+        else:
+            scraper.save_transcript_absent_cache()
 
 
 def serialize_results(results: Sequence[ChannelResult]) -> list[dict]:
     return DEFAULT_SCRAPER.serialize_results(results)
+
+
+def get_transcript_api() -> YouTubeTranscriptApi:
+    # The library is documented as not thread-safe (its fetcher writes consent cookies into its session),
+    # so each worker thread gets its own instance, reused for that thread's later requests.
+    api = getattr(_local, "transcript_api", None)
+    if api is None:
+        api = _local.transcript_api = YouTubeTranscriptApi()
+    return api
+
+
+def _fetch_transcript_text(video_id: str, languages: list[str]) -> str:
+    if _HAS_GET_TRANSCRIPT:
+        chunks = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+        return _join_transcript_text(part.get("text") for part in chunks)
+
+    try:
+        fetched = get_transcript_api().fetch(video_id, languages=languages)
+        return _join_transcript_text(getattr(snippet, "text", None) for snippet in fetched)
+    except Exception as preferred_error:  # noqa: BLE001
+        # Fallback: if preferred languages are missing, use first available transcript.
+        transcripts = sorted(get_transcript_api().list(video_id), key=lambda transcript: transcript.is_generated)
+        for transcript in transcripts:
+            try:
+                fetched = transcript.fetch()
+                text = _join_transcript_text(getattr(snippet, "text", None) for snippet in fetched)
+                if text:
+                    return text
+            except Exception:  # noqa: BLE001
+                continue
+
+        if transcripts:
+            # Captions exist but none could be fetched, so this must not read as "no captions".
+            raise RuntimeError(str(preferred_error)) from preferred_error
+        raise
+
+
+def _join_transcript_text(texts: Iterable[str | None]) -> str:
+    # Timedtext snippets carry no padding of their own, so they are written as-is into one buffer
+    # and the result is stripped once, instead of stripping and collecting every snippet.
+    buffer = StringIO()
+    for text in texts:
+        if text:
+            buffer.write(text)
+            buffer.write(" ")
+    if buffer.tell() == 0:
+        return ""
+    return buffer.getvalue().strip()
+
+
+def _older_than(published_at: datetime | None, age: timedelta) -> bool:
+    if published_at is None:
+        return False
+    # Naive timestamps are read as UTC, as in parse_entry_datetime.
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - published_at >= age
+
+
+def _isoformat_utc(value: datetime) -> str:
+    # Matches pydantic's JSON datetime format, which writes a zero UTC offset as "Z".
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 
 from app.ingest.anthropic import (
@@ -10,6 +9,8 @@ from app.ingest.anthropic import (
     collect_recent_anthropic_articles,
     serialize_anthropic_articles,
 )
+from app.ingest.cli_args import positive_int
+from app.ingest.json_output import write_json
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,6 +35,12 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_ANTHROPIC_FEEDS,
         help="Override feed URLs (space-separated).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=None,
+        help="Number of feeds to fetch at once (default: all of them).",
+    )
     parser.add_argument(
         "--markdown-url",
         default=None,
@@ -57,10 +64,11 @@ def main() -> None:
         lookback_hours=args.hours,
         max_articles_per_feed=args.max_per_feed,
         feed_urls=args.feed_urls,
+        max_workers=args.concurrency,
     )
 
     print(f"Articles found in last {args.hours}h: {len(articles)}")
-    print(json.dumps(serialize_anthropic_articles(articles), indent=2, ensure_ascii=False))
+    write_json(serialize_anthropic_articles(articles))
 
 
 if __name__ == "__main__":
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import argparse
 
-from app.ingest.enrich import run_enrich
+from app.ingest.cli_args import positive_int
+from app.ingest.enrich import DEFAULT_ENRICH_CONCURRENCY, run_enrich
+from app.ingest.http_client import build_http_session
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,12 +23,24 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional cap for total items per source.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=DEFAULT_ENRICH_CONCURRENCY,
+        help="Number of markdown/transcript fetches to run at once.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    result = run_enrich(lookback_hours=args.hours, max_items=args.max_items)
+    with build_http_session() as http_session:
+        result = run_enrich(
+            lookback_hours=args.hours,
+            max_items=args.max_items,
+            http_session=http_session,
+            concurrency=args.concurrency,
+        )
     print(f"Updated items: {result['updated']}")
 
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import argparse
 
+from app.ingest.cli_args import positive_int
+from app.ingest.http_client import build_http_session
 from app.ingest.pipeline import run_ingest
 
 
@@ -20,15 +22,24 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Use Docling to fetch full markdown content for OpenAI and Anthropic articles.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=None,
+        help="Worker threads for YouTube channels, transcripts, and article markdown (defaults: 8, 8, and 4).",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    result = run_ingest(
-        lookback_hours=args.hours,
-        fetch_markdown=args.fetch_markdown,
-    )
+    with build_http_session() as http_session:
+        result = run_ingest(
+            lookback_hours=args.hours,
+            fetch_markdown=args.fetch_markdown,
+            http_session=http_session,
+            concurrency=args.concurrency,
+        )
     print(f"Inserted articles: {result['inserted']}")
 
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 
 from app.ingest.openai import (
@@ -10,6 +9,8 @@ from app.ingest.openai import (
     collect_recent_openai_articles,
     serialize_openai_articles,
 )
+from app.ingest.http_client import build_http_session
+from app.ingest.json_output import write_json
 
 
 def parse_args() -> argparse.Namespace:
@@ -52,14 +53,16 @@ def main() -> None:
         print(markdown)
         return
 
-    articles = collect_recent_openai_articles(
-        lookback_hours=args.hours,
-        max_articles=args.max_articles,
-        rss_url=args.rss_url,
-    )
+    with build_http_session() as http_session:
+        articles = collect_recent_openai_articles(
+            lookback_hours=args.hours,
+            max_articles=args.max_articles,
+            rss_url=args.rss_url,
+            session=http_session,
+        )
 
     print(f"Articles found in last {args.hours}h: {len(articles)}")
-    print(json.dumps(serialize_openai_articles(articles), indent=2, ensure_ascii=False))
+    write_json(serialize_openai_articles(articles))
 
 
 if __name__ == "__main__":
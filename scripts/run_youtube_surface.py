@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 import sys
 
-from app.ingest.youtube import collect_latest_videos, load_channel_inputs, serialize_results
+from app.ingest.cli_args import positive_int
+from app.ingest.disk_cache import load_channel_id_cache, save_channel_id_cache
+from app.ingest.youtube import (
+    DEFAULT_CHANNEL_WORKERS,
+    YouTubeSurfaceScraper,
+    load_channel_inputs,
+    serialize_results,
+)
+from app.ingest.json_output import write_json
 
 
 def parse_args() -> argparse.Namespace:
@@ -46,6 +53,12 @@ def parse_args() -> argparse.Namespace:
         default=["en", "en-US"],
         help="Preferred transcript languages in order.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=DEFAULT_CHANNEL_WORKERS,
+        help="Number of channels, and of transcripts, to fetch at once.",
+    )
     return parser.parse_args()
 
 
@@ -54,30 +67,43 @@ def main() -> None:
         sys.stdout.reconfigure(encoding="utf-8")
 
     args = parse_args()
-    channels = list(args.channels)
+    channels = [channel.strip() for channel in args.channels if channel.strip()]
 
     channel_file = Path(args.channels_file)
     if channel_file.exists():
+        # load_channel_inputs already returns stripped, unique entries.
         channels.extend(load_channel_inputs(str(channel_file)))
 
-    channels = [channel.strip() for channel in channels if channel.strip()]
+    channels = list(dict.fromkeys(channels))
     if not channels:
         raise SystemExit(
             "No channels provided. Use --channels or create app/ingest/channels.txt with one channel per line."
         )
 
-    results = collect_latest_videos(
-        channel_inputs=channels,
-        lookback_hours=args.hours,
-        include_transcripts=not args.skip_transcripts,
-        transcript_languages=args.languages,
-        max_videos_per_channel=args.max_per_channel,
+    # Only inputs that are not in the on-disk cache are resolved over the network.
+    cached_channel_ids = load_channel_id_cache()
+    with YouTubeSurfaceScraper(transcript_workers=args.concurrency) as scraper:
+        scraper.prime_channel_id_cache(cached_channel_ids)
+        results = scraper.collect_latest_videos(
+            channel_inputs=channels,
+            lookback_hours=args.hours,
+            include_transcripts=not args.skip_transcripts,
+            transcript_languages=args.languages,
+            max_videos_per_channel=args.max_per_channel,
+            max_workers=args.concurrency,
+        )
+    save_channel_id_cache(
+        {
+            result.channel_input: result.channel_id
+            for result in results
+            if result.channel_id and cached_channel_ids.get(result.channel_input) != result.channel_id
+        }
     )
 
     total_videos = sum(len(result.videos) for result in results)
     print(f"Channels checked: {len(results)}")
     print(f"Videos found in last {args.hours}h: {total_videos}")
-    print(json.dumps(serialize_results(results), indent=2, ensure_ascii=False))
+    write_json(serialize_results(results))
 
 
 if __name__ == "__main__":